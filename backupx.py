@@ -3,10 +3,10 @@
 Secure Automated Backup Tool (Linux & Windows)
 
 This tool automates encrypted backups of files or directories with optional
-remote transfer via SSH. Supports ZIP (AES-256) and 7Z formats with optional
-post-encryption.
+remote transfer via SSH. Supports ZIP and 7Z formats with optional native
+AES-256 encryption.
 
- - AES-256 encryption (native for ZIP, optional for 7Z)
+ - AES-256 encryption (native for ZIP and 7Z)
  - SSH key-based transfer support
  - Safe path handling and symlink protection
  - Suitable for scheduled jobs (cron, Task Scheduler)
@@ -31,14 +31,25 @@ import backupxLib.utils  # Module reserved for helper functions
 from pathlib import Path
 from datetime import datetime
 from backupxLib.check_backup_space import has_enough_space_for_backup
+from backupxLib.scan import collect_tree
 from backupxLib.create_7z_archive import create_7z
 from backupxLib.create_zip_archive import create_zip_aes
-from backupxLib.SSHBackupManager import create_ssh_client, transfer_backup
+from backupxLib.SSHBackupManager import create_ssh_client, transfer_backup, transfer_backup_external, TRANSFER_METHODS
 from backupxLib.initialize_loggers import setup_loggers
-from backupxLib.aes_encrypt_inplace import encrypt_file
 from backupxLib.delete_old_backups import delete_backups
 
 
+# Concrete level per compression mode and format, with the trade-off it implies
+COMPRESSION_MODES = {
+    "fast": ({"zip": 1, "7z": 1}, "fastest backups, larger archives"),
+    "balanced": ({"zip": 6, "7z": 5}, "most of the size reduction at moderate CPU cost"),
+    "archival": ({"zip": 9, "7z": 9}, "smallest archives, several times slower for a few percent"),
+}
+
+# Password files larger than this can't hold a valid (< 255 character) password
+PASSWORD_READ_LIMIT = 1024
+
+
 def establish_ssh_connection(ssh_host: str, ssh_port: int, ssh_user: str, ssh_key_path: str, error_logger: 'logging.Logger') -> 'paramiko.SSHClient':
     """
     Attempts to establish an SSH connection using the provided parameters
@@ -80,6 +91,29 @@ def establish_ssh_connection(ssh_host: str, ssh_port: int, ssh_user: str, ssh_ke
 
 
 
+def resolve_compression_level(compression: str, compression_mode: str, compression_level: int | None) -> tuple[str, int]:
+    """
+    Selects the compression level from the tiered compression_mode setting
+
+    Args:
+        compression (str): Archive format ("zip" or "7z")
+        compression_mode (str): "fast", "balanced" or "archival"; empty if not set
+        compression_level (int | None): Deprecated raw level (0-9), used only when no mode is set
+
+    Returns:
+        tuple[str, int]: The effective mode ("raw" for a legacy level) and compression level
+    """
+    if compression_mode not in COMPRESSION_MODES and compression_level is not None:
+        return "raw", compression_level if 0 <= compression_level <= 9 else 1
+
+    if compression_mode not in COMPRESSION_MODES:
+        compression_mode = "balanced"
+
+    levels, _ = COMPRESSION_MODES[compression_mode]
+    return compression_mode, levels[compression]
+
+
+
 def generate_backup_filename(destination: str,  date_and_time: str) -> str:
     """
     Appends a timestamp to the filename
@@ -105,6 +139,8 @@ def main(
     destination: str,
     compression: str,
     compression_level: int,
+    compression_codec: str,
+    archival_mode: bool,
     encryption: bool,
     ssh_connection: bool,
     password: str,
@@ -114,6 +150,7 @@ def main(
     ssh_key_path: str,
     ssh_remote_path: str,
     ssh_local_path: str,
+    transfer_method: str,
     date_and_time: str,
     error_logger: 'logging.Logger'
     ) -> None:
@@ -121,6 +158,7 @@ def main(
     Main execution routine
 
     Handles:
+    - Single scan of the source tree, shared by the steps below
     - Free space checking
     - Archive creation (ZIP/7Z)
     - Optional AES encryption
@@ -134,36 +172,52 @@ def main(
         # Generate the final backup filename based on the destination and timestamp
         backup_filename = generate_backup_filename(destination,  date_and_time)
 
-        if not has_enough_space_for_backup(source, destination, compression, backup_filename, password):
+        # Walk the source once; the space check and the ZIP writer reuse the listing
+        source_files = collect_tree(source)
+        source_size = sum(size for _, size in source_files)
+
+        if not has_enough_space_for_backup(source, destination, backup_filename, source_size):
             error_logger.error("Insufficient space. Backup canceled")
             sys.exit(1)
 
 
         if compression == "zip":
-            create_zip_aes(backup_filename, source, password, compression_level)
+            create_zip_aes(backup_filename, source, password, compression_level, archival_mode, source_files)
 
         elif compression == "7z":
-            create_7z(backup_filename, source, compression_level, password, encryption)
-            if password and encryption:
-                 encrypt_file(backup_filename, password)
-                 os.remove(backup_filename)
+            create_7z(backup_filename, source, compression_level, password, encryption, compression_codec)
 
         if ssh_connection:
           if ssh_key_path:
             if ssh_local_path == destination:
-               ssh_local_path = backup_filename + ".aes" if password and encryption and backup_filename.endswith('.7z')  else backup_filename
-
-            ssh = establish_ssh_connection(ssh_host, ssh_port, ssh_user, ssh_key_path, error_logger)
-
-            try:
-               transfer_backup(
-                   ssh_client=ssh,
+               ssh_local_path = backup_filename
+
+            transferred = False
+
+            # rsync/scp run over OpenSSH; paramiko SFTP remains the fallback
+            if transfer_method != "sftp":
+               transferred = transfer_backup_external(
+                   method=transfer_method,
+                   hostname=ssh_host,
+                   port=ssh_port,
+                   username=ssh_user,
+                   key_file=ssh_key_path,
                    local_path=ssh_local_path,
                    remote_path=ssh_remote_path
                )
 
-            finally:
-                ssh.close()
+            if not transferred:
+               ssh = establish_ssh_connection(ssh_host, ssh_port, ssh_user, ssh_key_path, error_logger)
+
+               try:
+                  transfer_backup(
+                      ssh_client=ssh,
+                      local_path=ssh_local_path,
+                      remote_path=ssh_remote_path
+                  )
+
+               finally:
+                   ssh.close()
 
           else:
             error_logger.error("Connection failed: Invalid private key path")
@@ -179,8 +233,8 @@ def main(
 
 if __name__ == "__main__":
 
-   # Get error logger; ignore second return value
-   error_logger, _ = setup_loggers()
+   # Get error and info loggers
+   error_logger, info_logger = setup_loggers()
 
 
    try:
@@ -245,8 +299,14 @@ if __name__ == "__main__":
             return source
 
         try:
-            with open(source, 'r', encoding='utf-8') as f:
-                   password_str = f.read().strip()
+            # Check the size before reading so an oversized file is never loaded into memory;
+            # the 255-character limit itself applies to the decoded, stripped password
+            if os.stat(source).st_size >= PASSWORD_READ_LIMIT:
+               error_logger.error(f"[SECURITY] The content of '{source}' exceeds the safe length limit (>= 255 characters). Potential buffer overflow risk")
+               sys.exit(1)
+
+            with open(source, 'rb') as f:
+                   password_str = f.read(PASSWORD_READ_LIMIT).decode('utf-8', errors='strict').strip()
                    if len(password_str) >= 255:
                       error_logger.error(f"[SECURITY] The content of '{source}' exceeds the safe length limit (>= 255 characters). Potential buffer overflow risk")
                       sys.exit(1)
@@ -290,17 +350,28 @@ if __name__ == "__main__":
 
 
    # Load backup settings: paths, compression, encryption, SSH, and password file.
-   # Defaults: compression_level=1, encryption=False, ssh_connection=False.
+   # Defaults: compression_mode=balanced, encryption=False, ssh_connection=False.
+   # compression_level is deprecated and only used when compression_mode is not set.
    source = config.get('BACKUP', 'source')
    destination = config.get('BACKUP', 'destination')
    compression = config.get('BACKUP', 'compression')
 
+   compression_mode = config.get('BACKUP', 'compression_mode', fallback='')
+
    try:
-      compression_level = config.getint('BACKUP', 'compression_level')
+      compression_level = config.getint('BACKUP', 'compression_level', fallback=None)
 
    except ValueError:
       compression_level = 1
 
+   compression_codec = config.get('BACKUP', 'compression_codec', fallback='lzma2')
+
+   try:
+      archival_mode = config.getboolean('BACKUP', 'archival_mode', fallback=False)
+
+   except ValueError:
+      archival_mode = False
+
    try:
      encryption = config.getboolean('BACKUP', 'encryption')
 
@@ -337,6 +408,7 @@ if __name__ == "__main__":
    ssh_key_path = config.get('BACKUP', 'ssh_key_path') if ssh_connection else None
    ssh_remote_path = config.get('BACKUP', 'ssh_remote_path') if ssh_connection else None
    ssh_local_path = config.get('BACKUP', 'ssh_local_path') if ssh_connection else None
+   transfer_method = config.get('BACKUP', 'transfer_method', fallback='sftp') if ssh_connection else None
 
 
 
@@ -352,14 +424,17 @@ if __name__ == "__main__":
       "source": 1024,
       "destination": 1024,
       "compression": 20,
+      "compression_mode": 20,
       "compression_level": 10,
+      "compression_codec": 20,
       "password_path": 1024,
       "ssh_host": 255,
       "ssh_port": 10,
       "ssh_user": 255,
       "ssh_key_path": 1024,
       "ssh_remote_path": 1024,
-      "ssh_local_path": 1024
+      "ssh_local_path": 1024,
+      "transfer_method": 20
      }
 
 
@@ -367,14 +442,17 @@ if __name__ == "__main__":
       source,
       destination,
       compression,
+      compression_mode,
       compression_level,
+      compression_codec,
       password_path,
       ssh_host,
       ssh_port,
       ssh_user,
       ssh_key_path,
       ssh_remote_path,
-      ssh_local_path
+      ssh_local_path,
+      transfer_method
      ]
 
 
@@ -426,8 +504,29 @@ if __name__ == "__main__":
      os.makedirs(os.path.dirname(destination), exist_ok=True)
 
 
-     if not 0 <= compression_level <= 9:
-       compression_level = 1
+     compression_mode, compression_level = resolve_compression_level(
+       compression,
+       compression_mode.strip().lower() if compression_mode else "",
+       compression_level
+     )
+
+     if compression_mode == "raw":
+       info_logger.warning("compression_level is deprecated, set compression_mode = fast | balanced | archival instead")
+       info_logger.info(f"Compression: {compression} raw level {compression_level}")
+
+     else:
+       # Archival mode lifts the ZIP level clamp
+       archival_mode = archival_mode or compression_mode == "archival"
+       info_logger.info(
+         f"Compression: {compression} {compression_mode} mode -> level {compression_level} "
+         f"({COMPRESSION_MODES[compression_mode][1]})"
+       )
+
+
+     compression_codec = compression_codec.lower() if compression_codec else "lzma2"
+
+     if compression_codec not in ["lzma2","zstd"]:
+       compression_codec = "lzma2"
 
 
      if not password_path:
@@ -448,6 +547,12 @@ if __name__ == "__main__":
          vars_dict[key] = None
 
 
+     transfer_method = transfer_method.lower() if transfer_method else "sftp"
+
+     if transfer_method not in TRANSFER_METHODS:
+       transfer_method = "sftp"
+
+
      if encryption:
         password = load_password_source(password_path, False, error_logger, home_dir)
 
@@ -478,6 +583,8 @@ if __name__ == "__main__":
     destination,               # Destination path
     compression,               # Compression format
     compression_level,         # Compression level 0-9
+    compression_codec,         # 7z codec (lzma2/zstd)
+    archival_mode,             # Allow ZIP levels 7-9
     encryption,                # Use encryption
     ssh_connection,            # SSH enabled?
     password,             # Path or loaded password
@@ -485,6 +592,7 @@ if __name__ == "__main__":
     ssh_user, ssh_key_path,    # Auth info
     ssh_remote_path,           # Remote backup path
     ssh_local_path,            # Local copy of backup
+    transfer_method,           # sftp/rsync/scp
     date_and_time,             # Timestamp
     error_logger               # Logger for errors
    )
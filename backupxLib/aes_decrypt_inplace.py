@@ -1,44 +1,95 @@
+import logging
 import os
 import sys
+import tempfile
+from typing import BinaryIO
 from hashlib import sha256
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad
-from backupxLib.initialize_loggers import setup_loggers
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
+from backupxLib.utils import advise_sequential
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
+
+# .aes layout written by older BackupX releases: iv || AES-256-CBC ciphertext (PKCS7 padded)
+IV_SIZE = 16
+
+# Size of each block read from disk and pushed through the cipher
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Decrypted archives up to this size stay in memory; larger ones spill to a temp file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024  # 64MB
+
+# RAM-backed tmpfs that keeps spilled plaintext off persistent storage, when it has room
+SHM_DIR = '/dev/shm'
 
 def derive_key(password: str) -> bytes:
-    """Derives a 32-byte AES-256 key using SHA-256."""
+    """Derives the 32-byte AES-256 key older releases used: SHA-256 of the password."""
     return sha256(password.encode()).digest()
 
-def decrypt_file(file_path: str, password: str) -> None:
-    """Decrypts a .aes file in-place"""
-    try:
+def decrypt_into(file_path: str, password: str, dst: BinaryIO) -> None:
+    """
+    Streams the decrypted contents of a .aes file into dst.
+    Raises ValueError if the padding is invalid (wrong password or corrupted data).
+    """
+    with open(file_path, 'rb') as src:
+        advise_sequential(src.fileno())
+        iv = src.read(IV_SIZE)
 
-        if not os.path.isfile(file_path):
-            error_logger.error(f"[!] File not found: {file_path}")
+        if len(iv) < IV_SIZE:
+            error_logger.error(f"[!] Encrypted file too short or corrupted: {file_path}")
             sys.exit(1)
 
-        key = derive_key(password)
+        # OpenSSL runs CBC decryption with AES-NI (or ARMv8 CE) when available
+        decryptor = Cipher(algorithms.AES(derive_key(password)), modes.CBC(iv)).decryptor()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
 
-        with open(file_path, 'rb') as f:
-            data = f.read()
+        # Stream the ciphertext in fixed-size chunks so memory stays O(CHUNK_SIZE);
+        # the padding is only checked at the end, so callers must discard dst if it raises
+        while chunk := src.read(CHUNK_SIZE):
+            dst.write(unpadder.update(decryptor.update(chunk)))
+        dst.write(unpadder.update(decryptor.finalize()) + unpadder.finalize())
 
-        if len(data) < 16:
-            error_logger.error(f"[!] Encrypted file too short or corrupted: {file_path}")
+def spool_dir_for(size: int) -> str | None:
+    """
+    Returns SHM_DIR if it can hold size bytes, otherwise None (the default temp dir).
+    tmpfs is usually capped at half of RAM, so multi-GB archives go to disk instead.
+    """
+    try:
+        stats = os.statvfs(SHM_DIR)
+        if stats.f_bavail * stats.f_frsize > size:
+            return SHM_DIR
+
+    except (OSError, AttributeError):  # No /dev/shm, or no statvfs (Windows)
+        pass
+
+    return None
+
+def decrypt_stream(file_path: str, password: str) -> BinaryIO:
+    """
+    Decrypts a .aes file into a seekable temporary stream, positioned at the start.
+    The plaintext is never written next to the encrypted file; the caller closes the stream.
+    """
+    try:
+
+        if not os.path.isfile(file_path):
+            error_logger.error(f"[!] File not found: {file_path}")
             sys.exit(1)
 
-        iv = data[:16]
-        ciphertext = data[16:]
+        # The plaintext is at most as large as the .aes file
+        spool_dir = spool_dir_for(os.path.getsize(file_path))
+        stream = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=spool_dir)
 
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        plaintext = unpad(cipher.decrypt(ciphertext), AES.block_size)
+        try:
+            decrypt_into(file_path, password, stream)
 
-        # Restore original filename by removing .aes extension
-        original_path = file_path[:-4] if file_path.endswith('.aes') else file_path
+        except BaseException:
+            stream.close()
+            raise
 
-        with open(original_path, 'wb') as f:
-            f.write(plaintext)
+        stream.seek(0)
+        return stream
 
     except (ValueError, KeyError) as data:
         error_logger.error(f"[!] Decryption failed: incorrect password or corrupted data {str(data)}", exc_info=True)
@@ -1,22 +1,16 @@
+import logging
 import os
 import shutil
-from backupxLib.initialize_loggers import setup_loggers
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
+from backupxLib.scan import collect_tree
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
 
 
 def calculate_directory_size(path: str) -> int:
     """Calculates total size of a file or directory in bytes."""
-    if os.path.isfile(path):
-        return os.path.getsize(path)
-
-    total_size = 0
-    for dirpath, _, filenames in os.walk(path):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            if os.path.isfile(file_path):
-                total_size += os.path.getsize(file_path)
-    return total_size
+    return sum(size for _, size in collect_tree(path))
 
 
 def format_size(size_bytes: int) -> tuple[float, str]:
@@ -33,32 +27,31 @@ def format_size(size_bytes: int) -> tuple[float, str]:
 def has_enough_space_for_backup(
     source_path: str,
     destination_path: str,
-    compression: str,
     backup_filename: str,
-    password: str | None
+    source_size: int | None = None
 ) -> bool:
     """
     Checks if there is enough free space in the destination path to store a backup.
+
+    backupx passes source_size from its collect_tree listing, so the source is not
+    walked again; without it the source is sized here.
     """
     try:
-        # Calculate source size in bytes and MB
-        total_size_bytes = calculate_directory_size(source_path)
-        source_size_mb = total_size_bytes // (1024 * 1024)
-
-        # Calculate available space in destination (in MB)
         dest_dir = os.path.dirname(destination_path)
+
+        total_size_bytes = source_size if source_size is not None else calculate_directory_size(source_path)
         _, _, free = shutil.disk_usage(dest_dir)
-        free_mb = free // (1024 * 1024)
 
-        # Determine output file name
-        encrypted_output_path = f"{backup_filename}.aes" if compression == "7z" and password else backup_filename
+        # Source size and available space in destination (in MB)
+        source_size_mb = total_size_bytes // (1024 * 1024)
+        free_mb = free // (1024 * 1024)
 
         # Format size info for logging
         size_value, size_unit = format_size(total_size_bytes)
 
         info_logger.info(
             f"\nUncompressed source size: {size_value} {size_unit}"
-            f"\nGenerated backup file name: '{encrypted_output_path}'"
+            f"\nGenerated backup file name: '{backup_filename}'"
             f"\nAvailable disk space: {free_mb} MB"
         )
 
@@ -1,42 +1,67 @@
+import logging
 import py7zr
 import os
 import sys
-from backupxLib.initialize_loggers import setup_loggers
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
+from backupxLib.utils import drop_from_page_cache
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
 
-# Store the current working
-current_directory = os.getcwd()
+def zstd_level(compression_level: int) -> int:
+    """
+    Maps the 0-9 compression level onto the zstd tiers:
+    0-3 = fast (3), 4-6 = balanced (10), 7-9 = archival (19).
+    """
+    if compression_level <= 3:
+        return 3
+    if compression_level <= 6:
+        return 10
+    return 19
+
+def build_7z_filters(compression_level: int, codec: str, encrypted: bool = False) -> list[dict[str, int]]:
+    """Returns the py7zr filter chain for the selected codec ('lzma2' or 'zstd'), plus native 7z AES-256 if encrypted."""
+    if codec == "zstd":
+        filters = [{'id': py7zr.FILTER_ZSTD, 'level': zstd_level(compression_level)}]
+    else:
+        filters = [{'id': py7zr.FILTER_LZMA2, 'preset': compression_level}]
+
+    if encrypted:
+        filters.append({'id': py7zr.FILTER_CRYPTO_AES256_SHA256})
+
+    return filters
 
-def create_7z(archive_name: str, source_path: str, compression_level: int, password: str | None, encryption: bool) -> None:
+def create_7z(archive_name: str, source_path: str, compression_level: int, password: str | None, encryption: bool, codec: str = "lzma2") -> None:
     """
     Creates a .7z archive with configurable compression level.
 
     :param archive_name: Output .7z archive filename (including .7z extension)
     :param source_path: Path to the file or directory to compress
     :param compression_level: Compression level (0-9), where 0 = Store (fastest) and 9 = Maximum compression (slowest)
+    :param password: Password for the archive's native AES-256 encryption (used only if encryption is True)
+    :param encryption: Encrypt file contents and headers with the password
+    :param codec: Compression codec, 'lzma2' (default) or 'zstd' (much faster, similar ratio)
     """
     try:
 
-        parent_dir = os.path.dirname(source_path)
-        os.chdir(parent_dir)
-        source_path = os.path.basename(source_path)
+        encrypted = bool(password and encryption)
 
+        # Encryption happens inside py7zr while compressing, so no second pass over the archive is needed
         with py7zr.SevenZipFile(
             archive_name,
             'w',
-            filters=[{'id': py7zr.FILTER_LZMA2, 'preset': compression_level}]
+            filters=build_7z_filters(compression_level, codec, encrypted),
+            password=password if encrypted else None,
+            header_encryption=encrypted
         ) as archive:
-            archive.writeall(source_path)
-            source_path = os.path.abspath(source_path)
-            os.chdir(current_directory)
+            # arcname keeps entries relative to the source's parent without chdir
+            archive.writeall(source_path, arcname=os.path.basename(source_path))
 
-        if password and encryption:
-             archive_name += '.aes'
+        drop_from_page_cache(archive_name)
 
         info_logger.info(
             f"\nArchive '{archive_name}' created successfully from '{source_path}' "
-            f"\nWith compression level: {str(compression_level)} "
+            f"\nWith compression level: {str(compression_level)} ({codec})"
         )
 
     except Exception as error:
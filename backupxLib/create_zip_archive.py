@@ -1,14 +1,135 @@
+import logging
 import pyzipper
 import os
 import sys
-from backupxLib.initialize_loggers import setup_loggers
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pyzipper.zipfile import _ZipWriteFile
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
+from backupxLib.scan import collect_tree
+from backupxLib.utils import advise_sequential, drop_from_page_cache
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
 
-# Store the current working
-current_directory = os.getcwd()
+# Highest DEFLATE level used outside archival mode; above it the size gain is
+# marginal while compression time keeps growing
+MAX_DEFAULT_ZIP_LEVEL = 6
 
-def create_zip_aes(archive_name: str, source_path: str, password: str | None, compression_level: int) -> None:
+def zip_compression_level(compression_level: int, archival_mode: bool) -> int:
+    """
+    Applies the ZIP compression policy to the configured level.
+
+    - 0-3: fast tier, passed through.
+    - 4-6: balanced tier, passed through.
+    - 7-9: archival tier, clamped to 6 unless archival_mode is enabled.
+    """
+    if compression_level <= 3:
+        tier = "fast"
+    elif compression_level <= MAX_DEFAULT_ZIP_LEVEL:
+        tier = "balanced"
+    elif archival_mode:
+        tier = "archival"
+    else:
+        info_logger.warning(
+            f"Compression level {compression_level} gives marginal gains for a large CPU cost; "
+            f"clamping to {MAX_DEFAULT_ZIP_LEVEL} (set archival_mode = true to keep it)"
+        )
+        compression_level = MAX_DEFAULT_ZIP_LEVEL
+        tier = "balanced"
+
+    info_logger.info(f"ZIP compression tier: {tier} (level {compression_level})")
+    return compression_level
+
+# Files up to this size are deflated in parallel by worker threads; larger
+# files are streamed by pyzipper to keep memory usage bounded
+PARALLEL_MAX_FILE_SIZE = 8 * 1024 * 1024  # 8MB
+
+# Upper bound on deflate threads. Each one holds a raw file plus its compressed
+# copy, and as many finished buffers wait to be written, so peak memory is about
+# 2 * MAX_DEFLATE_WORKERS * PARALLEL_MAX_FILE_SIZE (~128MB) whatever the core count
+MAX_DEFLATE_WORKERS = 8
+
+
+class PrecompressedWriteFile(_ZipWriteFile):
+    """
+    pyzipper write handle that also accepts member data already deflated
+    by a worker, leaving only ZIP framing and AES encryption to the caller.
+    """
+
+    def write_precompressed(self, data: bytes, crc: int, file_size: int) -> None:
+        """Writes a complete raw DEFLATE stream with its precomputed CRC and size."""
+        # The stream is already complete; the compressor must not flush a second one
+        self._compressor = None
+        self._file_size += file_size
+        self._crc = crc
+        if self._encrypter:
+            data = self._encrypter.encrypt(data)
+        self._compress_size += len(data)
+        self._fileobj.write(data)
+
+
+def deflate_file(filepath: str, compression_level: int) -> tuple[bytes, int, int]:
+    """
+    Reads and deflates a single file (zlib releases the GIL while compressing).
+
+    Returns:
+        Tuple of (raw DEFLATE data, CRC-32, uncompressed size)
+    """
+    with open(filepath, 'rb') as f:
+        advise_sequential(f.fileno())
+        data = f.read()
+
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return compressed, zlib.crc32(data), len(data)
+
+
+def write_members(archive: 'pyzipper.ZipFile', members: list[tuple[str, str, int]], compression_level: int) -> None:
+    """
+    Adds (filepath, arcname, size) entries to the archive in order, deflating
+    small files on a thread pool while the main thread writes finished members.
+    """
+    archive.zipwritefile_cls = PrecompressedWriteFile
+    max_workers = min(os.cpu_count() or 1, MAX_DEFLATE_WORKERS)
+    pending = deque()
+
+    def flush_oldest() -> None:
+        filepath, arcname, future = pending.popleft()
+        compressed, crc, file_size = future.result()
+        zinfo = archive.zipinfo_cls.from_file(filepath, arcname)
+        zinfo.compress_type = pyzipper.ZIP_DEFLATED
+        zinfo.file_size = file_size
+        with archive.open(zinfo, 'w') as dest:
+            dest.write_precompressed(compressed, crc, file_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for filepath, arcname, size in members:
+            if size > PARALLEL_MAX_FILE_SIZE:
+                while pending:
+                    flush_oldest()
+                archive.write(filepath, arcname)
+                continue
+
+            pending.append((filepath, arcname, pool.submit(deflate_file, filepath, compression_level)))
+
+            # Bound the number of compressed buffers held in memory
+            if len(pending) > max_workers:
+                flush_oldest()
+
+        while pending:
+            flush_oldest()
+
+
+def create_zip_aes(
+    archive_name: str,
+    source_path: str,
+    password: str | None,
+    compression_level: int,
+    archival_mode: bool = False,
+    files: list[tuple[str, int]] | None = None
+) -> None:
     """
     Creates a ZIP archive with optional AES-256 encryption and configurable compression level using pyzipper.
 
@@ -16,11 +137,15 @@ def create_zip_aes(archive_name: str, source_path: str, password: str | None, co
     :param source_path: Path to file or folder to compress
     :param password: Optional password for AES-256 encryption
     :param compression_level: Compression level (0-9), 0 = Store (no compression), 9 = Maximum compression
+    :param archival_mode: Allow levels 7-9; otherwise they are clamped to 6
+    :param files: Optional (path, size) listing of source_path from collect_tree, to avoid walking it again
     """
     try:
 
+        compression_level = zip_compression_level(compression_level, archival_mode)
+
+        # Entries are named relative to the source's parent directory
         parent_dir = os.path.dirname(source_path)
-        os.chdir(parent_dir)
 
         # Select ZIP class depending on whether a password is provided
         if password:
@@ -44,17 +169,19 @@ def create_zip_aes(archive_name: str, source_path: str, password: str | None, co
         with archive:
 
             if os.path.isdir(source_path):
-                for root, _, files in os.walk(source_path):
-                    for file in files:
-                        filepath = os.path.join(root, file)
-                        arcname = os.path.relpath(filepath, start=parent_dir)
-                        archive.write(filepath, arcname)
+                if files is None:
+                    files = collect_tree(source_path)
+
+                members = [
+                    (filepath, os.path.relpath(filepath, start=parent_dir), size)
+                    for filepath, size in files
+                ]
+                write_members(archive, members, compression_level)
             else:
                 arcname = os.path.relpath(source_path, start=parent_dir)
                 archive.write(source_path, arcname)
 
-
-        os.chdir(current_directory)
+        drop_from_page_cache(archive_name)
 
         info_logger.info(
             f"\nArchive '{archive_name}' created successfully from '{source_path}' "
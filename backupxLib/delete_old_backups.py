@@ -1,8 +1,15 @@
+import logging
 import os
+import re
 from datetime import datetime, timedelta
-from backupxLib.initialize_loggers import setup_loggers
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
+
+# Timestamp appended by generate_backup_filename, followed by the extension(s)
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+TIMESTAMP_PATTERN = re.compile(r'_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})(?:\.[^._]+)*$')
 
 def delete_backups(path_dir):
     """Delete backups older than 3 months based on datetime in filename"""
@@ -14,20 +21,17 @@ def delete_backups(path_dir):
         now = datetime.now()
         threshold = now - timedelta(days=90)
 
+        # The timestamp format is fixed-width and ordered from year to second,
+        # so string comparison matches chronological order
+        threshold_str = threshold.strftime(TIMESTAMP_FORMAT)
+
         for file in os.listdir(path_dir):
             file_path = os.path.join(path_dir, file)
 
             if os.path.isfile(file_path):
-                    base = os.path.splitext(file)[0]
-                    parts = base.split("_")
-
-                    if len(parts) < 3:
-                        continue
-
-                    date_str = f"{parts[1]}_{parts[2]}"
-                    file_datetime = datetime.strptime(date_str, "%Y-%m-%d_%H-%M-%S")
+                    match = TIMESTAMP_PATTERN.search(file)
 
-                    if file_datetime < threshold:
+                    if match and match.group(1) < threshold_str:
                         os.remove(file_path)
                         info_logger.info(f"Deleted old backup: {file}")
 
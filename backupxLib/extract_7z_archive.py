@@ -1,41 +1,52 @@
+import logging
 import os
 import py7zr
 import sys
-from backupxLib.initialize_loggers import setup_loggers
+from typing import BinaryIO
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
 
-error_logger, info_logger = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
 
-def is_within_directory(base_dir: str, target_path: str) -> bool:
+def is_within_directory(base_real: str, target_path: str) -> bool:
     """
     Checks if the target path is safely within the base directory (prevents Zip-Slip).
+    base_real is the destination's realpath, computed once per archive; symlinks in the
+    target are resolved too, so a link pointing outside the destination is rejected.
     """
-    base_dir = os.path.abspath(base_dir)
-    target_path = os.path.abspath(target_path)
-    return os.path.commonpath([base_dir]) == os.path.commonpath([base_dir, target_path])
+    target_real = os.path.realpath(target_path)
+    return target_real == base_real or target_real.startswith(os.path.join(base_real, ''))
 
-def extract_7z(source_file: str, destination_dir: str) -> None:
+def extract_7z(source_file: str | BinaryIO, destination_dir: str, password: str | None = None) -> None:
     """
     Securely extracts a .7z archive to the specified destination folder with validation
     to prevent Zip-Slip attacks.
 
-    :param source_file: Full path to the .7z archive file.
+    :param source_file: Full path to the .7z archive file, or a seekable file object holding it.
     :param destination_dir: Directory where the archive contents will be extracted.
+    :param password: Optional password for archives with native 7z AES-256 encryption.
     """
     try:
-        with py7zr.SevenZipFile(source_file, mode='r') as archive:
-            file_list = archive.getnames()
+        archive_label = source_file
+        if not isinstance(source_file, str):
+            archive_label = "decrypted archive stream"
+            source_file.seek(0)
+
+        with py7zr.SevenZipFile(source_file, mode='r', password=password) as archive:
+            file_list = archive.namelist()
+            base_real = os.path.realpath(destination_dir)
 
             for member in file_list:
                 target_path = os.path.join(destination_dir, member)
 
-                if not is_within_directory(destination_dir, target_path):
+                if not is_within_directory(base_real, target_path):
                     error_logger.error(f"Zip-Slip attempt detected in: {member}")
                     sys.exit(1)
 
             archive.extractall(path=destination_dir)
 
-        info_logger.info(f"Archive '{source_file}' extracted successfully to '{destination_dir}'.")
+        info_logger.info(f"Archive '{archive_label}' extracted successfully to '{destination_dir}'.")
 
     except Exception as error:
-        error_logger.error(f"Error extracting archive '{source_file}': {str(error)}", exc_info=True)
+        error_logger.error(f"Error extracting archive '{archive_label}': {str(error)}", exc_info=True)
         sys.exit(1)
@@ -1,47 +1,185 @@
+import logging
 import pyzipper
 import os
+import shutil
 import sys
-from backupxLib.initialize_loggers import setup_loggers
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME, INFO_LOGGER_NAME
 
-error_logger, info_logger = setup_loggers()
+try:
+    import libarchive
+    from libarchive.extract import extract_entries, EXTRACT_SECURE_NODOTDOT, EXTRACT_SECURE_SYMLINKS
+except (ImportError, OSError):  # python-libarchive-c or the libarchive C library is missing
+    libarchive = None
 
-def is_within_directory(base_dir: str, target_path: str) -> bool:
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
+
+# Buffer used to stream each member from the archive to disk
+COPY_BUFFER_SIZE = 1024 * 1024  # 1MB
+
+# Members up to this size are read whole and written with one raw os.write
+SMALL_FILE_SIZE = 64 * 1024  # 64KB
+
+# Flags for writing extracted files through raw file descriptors
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def write_small_file(target_path: str, data: bytes) -> None:
     """
-    Checks if the target path is safely within the base directory (prevents Zip-Slip).
+    Writes data to target_path with raw os.open/os.write, skipping the buffered file
+    object (and the fstat/isatty calls open() makes) that small members don't need.
     """
-    base_dir = os.path.abspath(base_dir)
-    target_path = os.path.abspath(target_path)
-    return os.path.commonpath([base_dir]) == os.path.commonpath([base_dir, target_path])
+    fd = os.open(target_path, WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-def extract_zip_aes(archive_name: str, destination: str, password: str | None) -> None:
+def extract_members(archive_name: str, password: bytes | None, members: list[tuple[str, str]]) -> None:
+    """
+    Extracts (member, target_path) pairs on a thread pool. pyzipper handles are not
+    thread-safe, so each worker thread opens the archive once and reuses its own handle.
     """
-    Securely extracts a ZIP archive with optional AES-256 decryption using pyzipper.
+    local = threading.local()
+    handles = []
+
+    def extract_one(member: str, target_path: str) -> None:
+        archive = getattr(local, "archive", None)
+        if archive is None:
+            archive = pyzipper.AESZipFile(archive_name, 'r')
+            if password:
+                archive.setpassword(password)
+            local.archive = archive
+            handles.append(archive)
+
+        info = archive.getinfo(member)
+
+        # Small files dominate on syscalls, not decompression: one read, one write
+        if info.file_size <= SMALL_FILE_SIZE:
+            write_small_file(target_path, archive.read(info))
+            return
+
+        # Stream the file through a fixed-size buffer instead of loading it whole
+        with archive.open(info) as source_file, open(target_path, 'wb') as target_file:
+            shutil.copyfileobj(source_file, target_file, COPY_BUFFER_SIZE)
+
+    # zlib and the AES backend release the GIL, so threads decompress in parallel
+    max_workers = max(1, min(os.cpu_count() or 1, len(members)))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(extract_one, member, target_path) for member, target_path in members]
+            for future in futures:
+                future.result()
+
+    finally:
+        for archive in handles:
+            archive.close()
+
+def extract_with_libarchive(archive_name: str, base_real: str, password: bytes | None) -> None:
+    """
+    Extracts the archive in a single pass through libarchive, whose AES and inflate
+    loops run entirely in C. libarchive writes relative to the working directory, so
+    each entry is re-rooted under base_real instead of changing directories; the
+    caller has already verified the password.
+    """
+    base_prefix = os.path.join(base_real, '')
+
+    def rooted_entries(archive):
+        for entry in archive:
+            # Links could point outside the destination; pyzipper never creates them either
+            if entry.issym or entry.islnk:
+                info_logger.warning(f"Skipping link entry '{entry.pathname}' -> '{entry.linkpath}'")
+                continue
+
+            # libarchive reads names pyzipper ignores (e.g. the Info-ZIP Unicode Path
+            # field), so its own pathname is checked here rather than trusting namelist().
+            # Drive letters and leading separators are dropped so the name stays relative
+            name = os.path.splitdrive(entry.pathname)[1].lstrip('/\\')
+            target_path = os.path.join(base_real, name)
+
+            # Check for Zip-Slip vulnerability, exactly as the pyzipper path does
+            target_real = os.path.realpath(target_path)
+            if not (target_real == base_real or target_real.startswith(base_prefix)):
+                error_logger.error(f"Zip-Slip attempt detected: {entry.pathname}")
+                sys.exit(1)
+
+            # The re-rooted name is absolute by construction, which is why
+            # EXTRACT_SECURE_NOABSOLUTEPATHS cannot be passed to extract_entries
+            entry.pathname = target_path
+            yield entry
+
+    with libarchive.file_reader(archive_name, passphrase=password) as archive:
+        extract_entries(rooted_entries(archive), EXTRACT_SECURE_NODOTDOT | EXTRACT_SECURE_SYMLINKS)
+
+def extract_zip_aes(archive_name: str, destination: str, password: bytes | None) -> None:
+    """
+    Securely extracts a ZIP archive with optional AES-256 decryption, using libarchive
+    when python-libarchive-c is installed and pyzipper otherwise.
     Validates internal paths to prevent Zip-Slip attacks.
 
     :param archive_name: Path to the .zip archive
     :param destination: Extraction destination folder
-    :param password: Optional password for decryption
+    :param password: Optional UTF-8 encoded password for decryption
     """
     try:
         with pyzipper.AESZipFile(archive_name, 'r') as archive:
-            if password:
-                archive.setpassword(password.encode())
+            # Duplicate names resolve to the last entry; extract each name only once.
+            # Sorted order keeps each subtree together, so its directory entries stay cached
+            names = sorted(set(archive.namelist()))
+
+            # libarchive truncates a target before it notices a wrong passphrase,
+            # so let pyzipper reject the password before anything is written
+            if libarchive is not None:
+                encrypted = next((info for info in archive.infolist() if info.flag_bits & 0x1), None)
+                if encrypted is not None:
+                    if password:
+                        archive.setpassword(password)
+                    with archive.open(encrypted) as probe:
+                        probe.read(1)
+
+        # Realpath of the destination and its "dir/" prefix, resolved once per archive
+        base_real = os.path.realpath(destination)
+        base_prefix = os.path.join(base_real, '')
+        members = []
+        last_dir = None
+        for member in names:
+            # Compute the full output path
+            target_path = os.path.join(destination, member)
+
+            # Check for Zip-Slip vulnerability; symlinks are resolved, so a link
+            # pointing outside the destination is rejected too
+            target_real = os.path.realpath(target_path)
+            if not (target_real == base_real or target_real.startswith(base_prefix)):
+                error_logger.error(f"Zip-Slip attempt detected: {member}")
+                sys.exit(1)
 
-            for member in archive.namelist():
-                # Compute the full output path
-                target_path = os.path.join(destination, member)
+            # Directory entries carry no data; just make sure they exist
+            if member.endswith(('/', '\\')):
+                os.makedirs(target_path, exist_ok=True)
+                continue
 
-                # Check for Zip-Slip vulnerability
-                if not is_within_directory(destination, target_path):
-                    error_logger.error(f"Zip-Slip attempt detected: {member}")
-                    sys.exit(1)
+            # Create directories up front so workers only decompress and write;
+            # sorted members share parents, so only call makedirs when it changes
+            parent_dir = os.path.dirname(target_path)
+            if parent_dir != last_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+                last_dir = parent_dir
 
-                # Create directory if needed before extraction
-                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            members.append((member, target_path))
 
-                # Extract file
-                with archive.open(member) as source_file, open(target_path, 'wb') as target_file:
-                    target_file.write(source_file.read())
+        if libarchive is not None:
+            try:
+                extract_with_libarchive(archive_name, base_real, password)
+            except (libarchive.ArchiveError, NotImplementedError) as error:
+                # e.g. libarchive built without crypto or passphrase support
+                info_logger.warning(f"libarchive could not extract '{archive_name}' ({error}); falling back to pyzipper")
+                extract_members(archive_name, password, members)
+        else:
+            extract_members(archive_name, password, members)
 
         info_logger.info(f"Archive '{archive_name}' extracted successfully to '{destination}'.")
 
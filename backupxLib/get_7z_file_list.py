@@ -1,19 +1,27 @@
+import logging
 import py7zr
-from backupxLib.initialize_loggers import setup_loggers
+from typing import BinaryIO
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME
 
-error_logger, _ = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
 
-def list_7z_contents(archive_path: str) -> list[str]:
+def list_7z_contents(archive_path: str | BinaryIO, password: str | None = None) -> list[str]:
     """
     Returns a list of the contents of a .7z archive.
 
-    :param archive_path: Path to the .7z archive
+    :param archive_path: Path to the .7z archive, or a seekable file object holding it
+    :param password: Password if the archive is encrypted (optional)
     :return: List of file and directory names inside the archive
     """
     try:
-        with py7zr.SevenZipFile(archive_path, mode='r') as archive:
-            return archive.getnames()
+        archive_label = archive_path
+        if not isinstance(archive_path, str):
+            archive_label = "decrypted archive stream"
+            archive_path.seek(0)
+
+        with py7zr.SevenZipFile(archive_path, mode='r', password=password) as archive:
+            return archive.namelist()
 
     except Exception as error:
-        error_logger.error(f"Error listing contents of '{archive_path}': {str(error)}", exc_info=True)
+        error_logger.error(f"Error listing contents of '{archive_label}': {str(error)}", exc_info=True)
         return []
@@ -1,20 +1,21 @@
+import logging
 import pyzipper
-from backupxLib.initialize_loggers import setup_loggers
+from backupxLib.initialize_loggers import ERROR_LOGGER_NAME
 
-error_logger, _ = setup_loggers()
+error_logger = logging.getLogger(ERROR_LOGGER_NAME)
 
-def list_zip_contents(archive_path: str, password: str | None) -> list[str]:
+def list_zip_contents(archive_path: str, password: bytes | None) -> list[str]:
     """
     Returns a list of the contents of a ZIP (AES-encrypted or not) archive.
 
     :param archive_path: Path to the .zip archive
-    :param password: Password if the archive is encrypted (optional)
+    :param password: UTF-8 encoded password if the archive is encrypted (optional)
     :return: List of file and directory names inside the archive
     """
     try:
         with pyzipper.AESZipFile(archive_path, 'r') as archive:
             if password:
-                archive.setpassword(password.encode())
+                archive.setpassword(password)
 
             return archive.namelist()
 
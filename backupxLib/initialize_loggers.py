@@ -1,22 +1,41 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+# Shared logger names; library modules fetch these with logging.getLogger and
+# only the entry scripts (backupx.py, decypherx.py) attach handlers to them
+ERROR_LOGGER_NAME = "backupx.error"
+INFO_LOGGER_NAME = "backupx.info"
+
+@lru_cache(maxsize=1)
 def setup_loggers() -> tuple[logging.Logger, logging.Logger]:
     """
     Sets up two loggers: one for errors and one for general information.
+    Call it once from the entry script; other modules use logging.getLogger.
 
     - Logs are saved in the 'logs' directory.
-    - Uses rotating file handlers (1MB max, 3 backups).
+    - Uses rotating file handlers (1MB max, 3 backups), opened on first use.
     - Formats messages with timestamp, level, and content.
     - error_logger logs ERROR level and above to 'errors.log'.
     - info_logger logs INFO level and above to 'info.log'.
     - Log propagation is disabled to avoid duplicate entries.
+    - Loggers only enqueue records; a background QueueListener does the file I/O.
+    - Repeated calls return the already configured loggers.
 
     Returns:
        Tuple of (error_logger, info_logger)
     """
+    error_logger = logging.getLogger(ERROR_LOGGER_NAME)
+    info_logger = logging.getLogger(INFO_LOGGER_NAME)
+
+    # Handlers are already attached (e.g. the cache was cleared); don't open the files again
+    if error_logger.handlers and info_logger.handlers:
+       return error_logger, info_logger
+
     try:
       os.makedirs('logs', exist_ok=True)
 
@@ -33,8 +52,7 @@ def setup_loggers() -> tuple[logging.Logger, logging.Logger]:
     max_log_size = 1024 * 1024  # 1MB
     backup_count = 3
 
-    # Create and configure error_logger
-    error_logger = logging.getLogger("error_logger")
+    # Configure error_logger
     error_logger.setLevel(logging.ERROR)
     error_logger.propagate = False
     error_logger.handlers.clear()  # Clear previous handlers
@@ -43,13 +61,13 @@ def setup_loggers() -> tuple[logging.Logger, logging.Logger]:
         os.path.join(logs_dir, "errors.log"),
         maxBytes=max_log_size,
         backupCount=backup_count,
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True  # Open the file on the first record, not at startup
     )
     error_handler.setFormatter(formatter)
-    error_logger.addHandler(error_handler)
+    error_handler.addFilter(logging.Filter(ERROR_LOGGER_NAME))
 
-    # Create and configure info_logger
-    info_logger = logging.getLogger("info_logger")
+    # Configure info_logger
     info_logger.setLevel(logging.INFO)
     info_logger.propagate = False
     info_logger.handlers.clear()  # Clear previous handlers
@@ -58,9 +76,21 @@ def setup_loggers() -> tuple[logging.Logger, logging.Logger]:
         os.path.join(logs_dir, "info.log"),
         maxBytes=max_log_size,
         backupCount=backup_count,
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True  # Open the file on the first record, not at startup
     )
     info_handler.setFormatter(formatter)
-    info_logger.addHandler(info_handler)
+    info_handler.addFilter(logging.Filter(INFO_LOGGER_NAME))
+
+    # Worker threads only put records on the queue; one listener thread writes and
+    # rotates both files. The name filters route each record to its own file.
+    log_queue = queue.SimpleQueue()
+    error_logger.addHandler(QueueHandler(log_queue))
+    info_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, error_handler, info_handler, respect_handler_level=True)
+    listener.start()
+    # Drain pending records before the interpreter exits (sys.exit included)
+    atexit.register(listener.stop)
 
     return error_logger, info_logger
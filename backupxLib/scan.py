@@ -0,0 +1,69 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from backupxLib.initialize_loggers import INFO_LOGGER_NAME
+from backupxLib.utils import is_network_filesystem
+
+info_logger = logging.getLogger(INFO_LOGGER_NAME)
+
+# Concurrent directory scans used on network filesystems to hide per-call latency
+NETWORK_SCAN_WORKERS = 64
+
+
+def scan_directory(path: str) -> tuple[list[tuple[str, int]], list[str]]:
+    """
+    Returns the (path, size) pairs of the files directly in path and its subdirectories.
+    Like os.walk, symlinked directories are not descended into and an unreadable or
+    vanished directory is skipped instead of aborting the scan. Symlinks to files are
+    listed with the size of their target, since archiving them stores the target's contents.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        files.append((entry.path, entry.stat().st_size))
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_symlink() and not os.path.exists(entry.path):
+                        info_logger.warning(f"Skipping broken symlink '{entry.path}'")
+
+                except OSError as error:  # Entry removed or unreadable mid-scan
+                    info_logger.warning(f"Skipping '{entry.path}': {error}")
+
+    except OSError as error:
+        info_logger.warning(f"Skipping directory '{path}': {error}")
+        return [], []
+
+    return files, subdirs
+
+
+def collect_tree(root: str) -> list[tuple[str, int]]:
+    """
+    Walks root once and returns a sorted list of (file path, size in bytes).
+
+    The result is shared by the space check and the archive creation so the
+    source tree is only scanned once per backup. Directories are scanned
+    breadth-first by a thread pool so that many scandir/stat calls are in
+    flight at once, which matters most on NFS/SMB.
+    """
+    if os.path.isfile(root):
+        return [(root, os.path.getsize(root))]
+
+    max_workers = NETWORK_SCAN_WORKERS if is_network_filesystem(root) else (os.cpu_count() or 1)
+
+    tree = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(scan_directory, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                tree.extend(files)
+                pending.update(pool.submit(scan_directory, subdir) for subdir in subdirs)
+
+    # Completion order is arbitrary; sort for a deterministic archive layout
+    tree.sort()
+    return tree
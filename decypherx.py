@@ -7,7 +7,7 @@ Decrypts and extracts .zip or .7z archives, including AES-encrypted files (.aes)
 
 Supported:
 - .zip (with/without AES)
-- .7z and .7z.aes
+- .7z (with/without native AES) and legacy .7z.aes
 
 Main features:
 - AES decryption using a password file
@@ -16,97 +16,164 @@ Main features:
 - Input validation and logging
 
 Usage examples:
-  python extractor.py -e backup.7z.aes -d key.txt -o ./restore
+  python extractor.py -e backup.7z -d key.txt -o ./restore
   python extractor.py -e archive.zip -l
 """
 
 import argparse
-import re
+import errno
 import sys
 import os
+from typing import BinaryIO
 from backupxLib.extract_zip_archive import extract_zip_aes
 from backupxLib.extract_7z_archive import extract_7z
 from backupxLib.initialize_loggers import setup_loggers
-from backupxLib.aes_decrypt_inplace import decrypt_file
+from backupxLib.aes_decrypt_inplace import decrypt_stream
 from backupxLib.get_7z_file_list import list_7z_contents
 from backupxLib.get_zip_file_list import list_zip_contents
 
 error_logger, info_logger = setup_loggers()
 
-# Regular expressions to detect .zip and .7z/.7z.aes file types
-ZIP_PATTERN = re.compile(r"\.zip$", re.IGNORECASE)
-SEVENZ_PATTERN = re.compile(r"\.7z(?:\.aes)?$", re.IGNORECASE)
+# Password files are read up to this many bytes; filling it means the file is too long
+PASSWORD_READ_LIMIT = 1024
 
 
-def rename_conflicting_files(source: str, destination: str, password: str | None, force: bool) -> None:
+def is_zip(path: str) -> bool:
+    """Returns True for .zip archives (case-insensitive)."""
+    return path.lower().endswith(".zip")
+
+
+def is_7z(path: str) -> bool:
+    """Returns True for .7z and legacy .7z.aes archives (case-insensitive)."""
+    return path.lower().endswith((".7z", ".7z.aes"))
+
+
+def list_archive(source: str, password: str | None, archive: str | BinaryIO | None = None) -> list[str]:
+    """
+    Returns the member names of a .zip or .7z archive, or an empty list for other formats.
+    The type is taken from source; archive is an already opened stream to read instead, if any.
+    """
+    if is_zip(source):
+        return list_zip_contents(archive or source, password.encode('utf-8') if password else None)
+    elif is_7z(source):
+        return list_7z_contents(archive or source, password)
+    return []
+
+
+def next_free_name(base: str, ext: str, existing: set[str]) -> str:
+    """
+    Returns the first of base_old{ext}, base_old_1{ext}, ... not present in existing.
+    """
+    new_name = f"{base}_old{ext}"
+    counter = 1
+
+    while new_name in existing:
+        new_name = f"{base}_old_{counter}{ext}"
+        counter += 1
+
+    return new_name
+
+
+def move_aside(destination: str, name: str, base: str, ext: str, existing: set[str]) -> None:
+    """
+    Renames destination/name to the next free *_old name without overwriting anything.
+    If another process takes the candidate first, the collision is reported by the
+    filesystem and the next name is tried. existing is updated in place.
+    """
+    current_path = os.path.join(destination, name)
+    is_dir = os.path.isdir(current_path)
+
+    while True:
+        new_name = next_free_name(base, ext, existing)
+        new_path = os.path.join(destination, new_name)
+
+        try:
+            if is_dir:
+                # Refuses an existing file or non-empty directory as the target
+                os.rename(current_path, new_path)
+            else:
+                # os.rename would silently replace an existing file on POSIX; link does not
+                try:
+                    os.link(current_path, new_path)
+                except FileExistsError:
+                    raise
+                except OSError:
+                    # Filesystem without hard links
+                    os.rename(current_path, new_path)
+                else:
+                    os.remove(current_path)
+
+        except OSError as error:
+            if error.errno not in (errno.EEXIST, errno.ENOTEMPTY, errno.ENOTDIR):
+                raise
+            existing.add(new_name)
+            continue
+
+        existing.discard(name)
+        existing.add(new_name)
+        return
+
+
+def rename_conflicting_files(source: str, destination: str, password: str | None, force: bool, archive_files: list[str] | None = None) -> None:
     """
     Renames existing files or directories in the destination to avoid overwriting.
 
     - Directories are renamed like: name_old, name_old_1, etc.
     - Files like: file_old.ext, file_old_1.ext, etc.
     - Skipped entirely if --force is enabled.
+    - archive_files is the archive listing if the caller already has it.
     """
     if force:
         return
 
     # Get list of files from inside the archive
-    if ZIP_PATTERN.search(source):
-        archive_files = list_zip_contents(source, password)
-    elif SEVENZ_PATTERN.search(source):
-        archive_files = list_7z_contents(source)
-    else:
+    if archive_files is None:
+        archive_files = list_archive(source, password)
+
+    if not archive_files:
         return
 
 
-    # Extract top-level directories from the archive paths
-    root_dirs = set(re.split(r"[\\/]", entry)[0] for entry in archive_files if "/" in entry or "\\" in entry)
+    # Extract top-level directories from the archive paths (text before the first separator)
+    root_dirs = set()
+    for entry in archive_files:
+        end = len(entry)
+        slash = entry.find("/")
+        end = slash if 0 <= slash < end else end
+        backslash = entry.find("\\")
+        end = backslash if 0 <= backslash < end else end
+        if end < len(entry):
+            root_dirs.add(entry[:end])
 
 
     # Ensure the parent directory is correctly defined
     parent_dir = os.path.dirname(destination)
 
     if root_dirs:
+      # One directory read up front; free names are then found in memory
+      existing = {item.name for item in os.scandir(destination)}
+
       for root_dir in root_dirs:
         potential_conflict_path = os.path.join(destination, root_dir)
 
-        if os.path.isdir(potential_conflict_path):
-            base = root_dir
-            new_name = f"{base}_old"
-            new_path = os.path.join(destination, new_name)
-            counter = 1
-
-            while os.path.exists(new_path):
-                new_name = f"{base}_old_{counter}"
-                new_path = os.path.join(destination, new_name)
-                counter += 1
-
-            os.rename(potential_conflict_path, new_path)
+        if root_dir in existing and os.path.isdir(potential_conflict_path):
+            move_aside(destination, root_dir, root_dir, "", existing)
 
     else:
       if os.path.isfile(destination):
          destination = parent_dir
 
+      existing = {item.name for item in os.scandir(destination)}
+
       for entry in archive_files:
         clean_entry = entry.rstrip("/\\")
 
-        if not any(separator in clean_entry for separator in ["/","\\"]):
+        if "/" not in clean_entry and "\\" not in clean_entry:
             potential_conflict_path = os.path.join(destination, clean_entry)
 
-            if os.path.isfile(potential_conflict_path):
+            if clean_entry in existing and os.path.isfile(potential_conflict_path):
                 base, ext = os.path.splitext(clean_entry)
-                if not ext:
-                  ext = ""
-
-                new_name = f"{base}_old{ext}"
-                new_path = os.path.join(destination, new_name)
-                counter = 1
-
-                while os.path.exists(new_path):
-                    new_name = f"{base}_old_{counter}{ext}"
-                    new_path = os.path.join(destination, new_name)
-                    counter += 1
-
-                os.rename(potential_conflict_path, new_path)
+                move_aside(destination, clean_entry, base, ext, existing)
 
 
 
@@ -121,14 +188,26 @@ def main(source: str, destination: str, password_path: str | None, listen: bool,
     try:
 
         if password_path and os.path.isfile(password_path):
-          with open(password_path, 'r', encoding='utf-8') as f:
-                   password = f.read().strip()
-                   if len(password) >= 255:
-                      error_logger.error(f"[SECURITY] The content of '{password_path}' exceeds the safe length limit (>= 255 characters). Potential buffer overflow risk")
-                      sys.exit(1)
+          # Read a bounded amount so an oversized file is never loaded whole
+          fd = os.open(password_path, os.O_RDONLY)
+          try:
+             raw = os.read(fd, PASSWORD_READ_LIMIT)
+          finally:
+             os.close(fd)
+
+          # A full read means the file holds more than any valid password; otherwise the
+          # limit applies to the decoded, stripped password as it always has
+          password = raw.decode('utf-8', 'strict').strip() if len(raw) < PASSWORD_READ_LIMIT else ''
+          if len(raw) >= PASSWORD_READ_LIMIT or len(password) >= 255:
+             error_logger.error(f"[SECURITY] The content of '{password_path}' exceeds the safe length limit (>= 255 characters). Potential buffer overflow risk")
+             sys.exit(1)
+
+          # pyzipper wants bytes; encode once here instead of in every worker thread
+          password_bytes = password.encode('utf-8')
 
         else:
             password = None
+            password_bytes = None
 
 
         if source and os.path.isfile(source[:-4]):
@@ -139,39 +218,44 @@ def main(source: str, destination: str, password_path: str | None, listen: bool,
             sys.exit(1)
 
         source = os.path.abspath(source)
-        os.makedirs(destination, exist_ok=True)
         destination = os.path.abspath(destination)
+        os.makedirs(destination, exist_ok=True)
+
+        archive = source
 
         if source.endswith(".aes"):
            if password:
-               decrypt_file(source, password)
-               os.remove(source)
+               # Decrypt into a temporary stream instead of rewriting the archive on disk;
+               # the .aes file is left untouched and no plaintext copy is written beside it
+               archive = decrypt_stream(source, password)
                source = source[:-4]
 
            else:
              error_logger.error(f"Missing or invalid password for decrypted archive: {source}")
              sys.exit(1)
 
-        rename_conflicting_files(source, destination, password, force)
+        try:
+            # Open the archive once for its listing; renaming and --listen both reuse it
+            archive_files = list_archive(source, password, archive) if listen or not force else None
 
-        if ZIP_PATTERN.search(source) and listen:
-              files = list_zip_contents(source, password)
-              for file in files:
-                 print(file)
+            rename_conflicting_files(source, destination, password, force, archive_files)
 
-        elif SEVENZ_PATTERN.search(source) and listen:
-              files = list_7z_contents(source)
-              for file in files:
-                 print(file)
+            if (is_zip(source) or is_7z(source)) and listen:
+                  for file in archive_files:
+                     print(file)
 
-        elif ZIP_PATTERN.search(source):
-            extract_zip_aes(source, destination, password)
+            elif is_zip(source):
+                extract_zip_aes(source, destination, password_bytes)
 
-        elif SEVENZ_PATTERN.search(source):
-            extract_7z(source, destination)
+            elif is_7z(source):
+                extract_7z(archive, destination, password)
 
-        else:
-            error_logger.error("Unsupported file format. Only .zip and .7z are allowed")
+            else:
+                error_logger.error("Unsupported file format. Only .zip and .7z are allowed")
+
+        finally:
+            if archive is not source:
+                archive.close()
 
     except KeyboardInterrupt:
         error_logger.error("Execution interrupted by user (Ctrl+C)", exc_info=True)
@@ -190,14 +274,6 @@ if __name__ == "__main__":
     # -l / --listen: Only list archive contents (no extraction)
     # -f / --force: Overwrite existing files/folders instead of renaming
 
-    # Ensure 'backups' directory exists; create it if it doesn't
-    try:
-      os.makedirs('backups', exist_ok=True)
-
-    except (FileExistsError, PermissionError):
-      error_logger.error("[ERROR]: ", exc_info=True)
-      sys.exit(1)
-
     # Argument parser setup
     parser = argparse.ArgumentParser(
         description="Decrypt and extract compressed archives (.zip, .7z)"
@@ -224,7 +300,7 @@ if __name__ == "__main__":
         dest="destination",
         required=False,
         type=str,
-        default=os.path.abspath('backups'),
+        default='backups',  # Resolved and created by main()
         metavar="FOLDER",
         help="Destination folder to extract contents to"
     )
@@ -243,25 +319,15 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    field_limits = {
-     "extract": 1024,
-     "destination": 1024,
-     "decipher": 1024
-    }
-
-
-    backup_config = [
-     args.extract,
-     args.destination,
-     args.decipher
-    ]
-
+    field_limits = (
+     ("extract", args.extract, 1024),
+     ("destination", args.destination, 1024),
+     ("decipher", args.decipher, 1024)
+    )
 
-    for field_name, value in zip(field_limits.keys(), backup_config):
-      max_length = field_limits[field_name]
-      value = '' if not value else value
 
-      if len(value) >= max_length:
+    for field_name, value, max_length in field_limits:
+      if value and len(value) >= max_length:
         error_logger.error(
             f"[SECURITY] Field '{field_name}' exceeds safe length: {len(value)} >= {max_length}\nPossible overflow or malformed input"
         )